@@ -12,9 +12,9 @@ This private submodule is *not* intended for importation by downstream callers.
 
 # ....................{ IMPORTS                            }....................
 from beartype.typing import (
-    Dict,
     ForwardRef,
     FrozenSet,
+    Mapping,
 )
 from beartype._cave._cavefast import (
     ClassType,
@@ -62,16 +62,20 @@ Note that the :class:`Set` abstract base class (ABC) rather than the concrete
 # ....................{ TYPES ~ beartype                   }....................
 # Types of *ALL* objects that may be decorated by @beartype, intentionally
 # listed in descending order of real-world prevalence for negligible efficiency
-# gains when performing isinstance()-based tests against this tuple. These
-# include the types of *ALL*...
+# gains when performing isinstance()-based tests against this tuple. This order
+# is measured rather than guessed against the "asyncio", "collections",
+# "email", and "json" standard packages. To remeasure and regenerate this order
+# against other packages, run from the root of this repository:
+#     PYTHONPATH=. python3 bin/sort_beartypeable.py numpy pandas --write
+# These include the types of *ALL*...
 TYPES_BEARTYPEABLE = (
     # Pure-Python unbound functions and methods.
     FunctionType,
-    # Pure-Python classes.
-    ClassType,
     # C-based builtin method descriptors wrapping pure-Python unbound methods,
     # including class methods, static methods, and property methods.
     MethodDecoratorBuiltinTypes,
+    # Pure-Python classes.
+    ClassType,
 )
 '''
 Tuple of all **beartypeable types** (i.e., types of all objects that may be
@@ -96,9 +100,9 @@ object dictionary) fails to define a given attribute or name).
 
 # ....................{ TYPES ~ module                     }....................
 # Defined below by the _init() function.
-TYPE_BUILTIN_NAME_TO_TYPE: Dict[str, type] = None  # type: ignore[assignment]
+TYPE_BUILTIN_NAME_TO_TYPE: Mapping[str, type] = None  # type: ignore[assignment]
 '''
-Dictionary mapping from the name of each **builtin type** (i.e., globally
+Read-only mapping from the name of each **builtin type** (i.e., globally
 accessible C-based type implicitly accessible from all scopes and thus
 requiring *no* explicit importation) to that type.
 '''
@@ -154,12 +158,13 @@ def _init() -> None:
 
     # Function-specific imports.
     from builtins import __dict__ as BUILTIN_NAME_TO_TYPE  # type: ignore[attr-defined]
+    from types import MappingProxyType
 
     # Global variables redefined below.
     global TYPE_BUILTIN_NAME_TO_TYPE, TYPES_BUILTIN
 
     # Dictionary mapping from,...
-    TYPE_BUILTIN_NAME_TO_TYPE = {
+    type_builtin_name_to_type = {
         # The name of each builtin type to that type
         builtin_name: builtin_value
         # For each attribute defined by the standard "builtins" module...
@@ -176,6 +181,13 @@ def _init() -> None:
         )
     }
 
+    # Freeze this dictionary into a read-only proxy, preventing callers from
+    # accidentally corrupting this global.
+    #
+    # Note that the "FrozenDict" class is intentionally *NOT* leveraged here,
+    # as the submodule declaring that class circularly imports this submodule.
+    TYPE_BUILTIN_NAME_TO_TYPE = MappingProxyType(type_builtin_name_to_type)
+
     # Frozenset of all builtin types, derived from this dictionary.
     TYPES_BUILTIN = frozenset(TYPE_BUILTIN_NAME_TO_TYPE.values())
 
@@ -320,7 +320,7 @@ signs.
 
 # ....................{ SETS ~ deprecated                  }....................
 # Initialized with automated inspection below in the _init() function.
-HINTS_PEP484_REPR_PREFIX_DEPRECATED: FrozenSet[str] = set()  # type: ignore[assignment]
+HINTS_PEP484_REPR_PREFIX_DEPRECATED: FrozenSet[str] = frozenset()
 '''
 Frozen set of all **bare deprecated** :pep:`484`-compliant **type hint
 representations** (i.e., machine-readable strings returned by the :func:`repr`
@@ -333,7 +333,7 @@ subscriptable classes).
 # The majority of this dictionary is initialized with automated inspection
 # below in the _init() function. The *ONLY* key-value pairs explicitly defined
 # here are those *NOT* amenable to such inspection.
-HINTS_REPR_IGNORABLE_SHALLOW: FrozenSet[str] = {  # type: ignore[assignment]
+HINTS_REPR_IGNORABLE_SHALLOW: FrozenSet[str] = frozenset((
     #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
     # CAUTION: Synchronize changes to this set with the corresponding
     # testing-specific set
@@ -371,7 +371,7 @@ HINTS_REPR_IGNORABLE_SHALLOW: FrozenSet[str] = {  # type: ignore[assignment]
     # ....................{ NON-PEP                        }....................
     # Machine-readable representations of shallowly ignorable type hints
     # published by PEP-noncompliant third-party type hints, including...
-}
+))
 '''
 Frozen set of all **shallowly ignorable PEP-compliant type hint
 representations** (i.e., machine-readable strings returned by the :func:`repr`
@@ -596,102 +596,133 @@ def _init() -> None:
     }
 
     # ..................{ CONSTRUCTION                       }..................
-    # For the fully-qualified name of each quasi-standard typing module...
-    for typing_module_name in TYPING_MODULE_NAMES:
-        # For the name of each sign...
+    # List of 2-tuples "(hint_repr_prefix, hint_sign)" of the substring
+    # prefixing the machine-readable representation of the typing attribute
+    # identified by each sign and that sign.
+    #
+    # Note that this list is intentionally constructed exactly once *BEFORE*
+    # iterating over typing modules below, as the contents of this list are
+    # invariant across typing modules.
+    hint_repr_prefix_signs = []
+
+    # For the name of each sign...
+    #
+    # Note that:
+    # * The inspect.getmembers() getter could also be called here. However,
+    #   that getter internally defers to dir() and getattr() with a
+    #   considerable increase in runtime complexity for no tangible benefit.
+    # * The "__dict__" dunder attribute should *NEVER* be accessed directly
+    #   on a module, as that attribute commonly contains artificial entries
+    #   *NOT* explicitly declared by that module (e.g., "__", "e__",
+    #   "ns__").
+    for hint_sign_name in dir(datapepsigns):
+        # If this name is *NOT* prefixed by the substring prefixing the names
+        # of all signs, this name is *NOT* the name of a sign. In this case,
+        # silently continue to the next sign.
+        if not hint_sign_name.startswith('HintSign'):
+            continue
+        # Else, this name is that of a sign.
+
+        # Sign with this name.
+        hint_sign = getattr(datapepsigns, hint_sign_name)
+
+        # Unqualified name of the typing attribute identified by this sign.
+        typing_attr_name = hint_sign_name[_HINT_SIGN_PREFIX_LEN:]
+        assert typing_attr_name, f'{hint_sign_name} not sign name.'
+
+        # Substring prefixing the machine-readable representation of this
+        # attribute, conditionally defined as either:
+        # * If this name is erroneously desynchronized from this
+        #   representation under the active Python interpreter, the actual
+        #   representation of this attribute under this interpreter (e.g.,
+        #   "AbstractContextManager" for the "typing.ContextManager" hint).
+        # * Else, this name is correctly synchronized with this
+        #   representation under the active Python interpreter. In this
+        #   case, fallback to this name as is (e.g., "List" for the
+        #   "typing.List" hint).
+        hint_repr_prefix = _HINT_TYPING_ATTR_NAME_TO_REPR_PREFIX.get(
+            typing_attr_name, typing_attr_name)
+
+        #FIXME: It'd be great to eventually generalize this to support
+        #aliases from one unwanted sign to another wanted sign. Perhaps
+        #something resembling:
+        ## In global scope above:
+        #_HINT_SIGN_REPLACE_SOURCE_BY_TARGET = {
+        #    HintSignProtocol: HintSignGeneric,
+        #}
+        #
+        #    # In this iteration here:
+        #    ...
+        #    hint_sign_replaced = _HINT_SIGN_REPLACE_SOURCE_BY_TARGET.get(
+        #        hint_sign, hint_sign)
+        #    hint_repr_prefix_signs.append(
+        #        (hint_repr_prefix, hint_sign_replaced))
+
+        # Record this prefix and sign.
+        hint_repr_prefix_signs.append((hint_repr_prefix, hint_sign))
+
+    # Tuple of the substring prefixing the fully-qualified names of all
+    # attributes declared by each quasi-standard typing module (e.g.,
+    # "typing."), precomputed once to enable the loops below to efficiently
+    # concatenate this prefix with each unqualified attribute name rather than
+    # repeatedly formatting both into a new f-string.
+    typing_module_prefixes = tuple(
+        f'{typing_module_name}.' for typing_module_name in TYPING_MODULE_NAMES)
+
+    # For the substring prefixing all attribute names of each quasi-standard
+    # typing module...
+    for typing_module_prefix in typing_module_prefixes:
+        # Map from the attribute identified by each sign in this module to that
+        # sign.
+        # print(f'[datapeprepr] Mapping repr("{typing_module_prefix}{hint_repr_prefix}[...]") -> {repr(hint_sign)}...')
+        HINT_REPR_PREFIX_ARGS_0_OR_MORE_TO_SIGN.update(
+            (typing_module_prefix + hint_repr_prefix, hint_sign)
+            for hint_repr_prefix, hint_sign in hint_repr_prefix_signs
+        )
+
+        # Map from the unqualified classname identifying each sign in this
+        # module to that sign.
         #
-        # Note that:
-        # * The inspect.getmembers() getter could also be called here. However,
-        #   that getter internally defers to dir() and getattr() with a
-        #   considerable increase in runtime complexity for no tangible benefit.
-        # * The "__dict__" dunder attribute should *NEVER* be accessed directly
-        #   on a module, as that attribute commonly contains artificial entries
-        #   *NOT* explicitly declared by that module (e.g., "__", "e__",
-        #   "ns__").
-        for hint_sign_name in dir(datapepsigns):
-            # If this name is *NOT* prefixed by the substring prefixing the
-            # names of all signs, this name is *NOT* the name of a sign. In this
-            # case, silently continue to the next sign.
-            if not hint_sign_name.startswith('HintSign'):
-                continue
-            # Else, this name is that of a sign.
-
-            # Sign with this name.
-            hint_sign = getattr(datapepsigns, hint_sign_name)
-
-            # Unqualified name of the typing attribute identified by this sign.
-            typing_attr_name = hint_sign_name[_HINT_SIGN_PREFIX_LEN:]
-            assert typing_attr_name, f'{hint_sign_name} not sign name.'
-
-            # Substring prefixing the machine-readable representation of this
-            # attribute, conditionally defined as either:
-            # * If this name is erroneously desynchronized from this
-            #   representation under the active Python interpreter, the actual
-            #   representation of this attribute under this interpreter (e.g.,
-            #   "AbstractContextManager" for the "typing.ContextManager" hint).
-            # * Else, this name is correctly synchronized with this
-            #   representation under the active Python interpreter. In this
-            #   case, fallback to this name as is (e.g., "List" for the
-            #   "typing.List" hint).
-            hint_repr_prefix = _HINT_TYPING_ATTR_NAME_TO_REPR_PREFIX.get(
-                typing_attr_name, typing_attr_name)
-
-            #FIXME: It'd be great to eventually generalize this to support
-            #aliases from one unwanted sign to another wanted sign. Perhaps
-            #something resembling:
-            ## In global scope above:
-            #_HINT_SIGN_REPLACE_SOURCE_BY_TARGET = {
-            #    HintSignProtocol: HintSignGeneric,
-            #}
-            #
-            #    # In this iteration here:
-            #    ...
-            #    hint_sign_replaced = _HINT_SIGN_REPLACE_SOURCE_BY_TARGET.get(
-            #        hint_sign, hint_sign)
-            #
-            #    # Map from that attribute in this module to this sign.
-            #    # print(f'[datapeprepr] Mapping repr("{typing_module_name}.{hint_repr_prefix}[...]") -> {repr(hint_sign)}...')
-            #    HINT_REPR_PREFIX_ARGS_0_OR_MORE_TO_SIGN[
-            #        f'{typing_module_name}.{hint_repr_prefix}'] = hint_sign_replaced
-
-            # Map from that attribute in this module to this sign.
-            # print(f'[datapeprepr] Mapping repr("{typing_module_name}.{hint_repr_prefix}[...]") -> {repr(hint_sign)}...')
-            HINT_REPR_PREFIX_ARGS_0_OR_MORE_TO_SIGN[
-                f'{typing_module_name}.{hint_repr_prefix}'] = hint_sign
-
-        # For the unqualified classname identifying each sign to that sign...
-        for typing_attr_name, hint_sign in _HINT_TYPE_BASENAMES_TO_SIGN.items():
-            # Map from that classname in this module to this sign.
-            # print(f'[datapeprepr] Mapping type "{typing_module_name}.{typing_attr_name}" -> {repr(hint_sign)}...')
-            HINT_TYPE_NAME_TO_SIGN[
-                f'{typing_module_name}.{typing_attr_name}'] = hint_sign
-
-        # For each shallowly ignorable typing non-class attribute name...
-        for typing_attr_name in _HINT_TYPING_ATTR_NAMES_IGNORABLE:
-            # Add that attribute relative to this module to this set.
-            # print(f'[datapeprepr] Registering ignorable non-class "{typing_module_name}.{typing_attr_name}"...')
-            HINTS_REPR_IGNORABLE_SHALLOW.add(  # type: ignore[attr-defined]
-                f'{typing_module_name}.{typing_attr_name}')
-
-        # For each shallowly ignorable typing classname...
-        for typing_type_name in _HINT_TYPING_TYPE_NAMES_IGNORABLE:
-            # Add that classname relative to this module to this set.
-            # print(f'[datapeprepr] Registering ignorable class "{typing_module_name}.{typing_attr_name}"...')
-            HINTS_REPR_IGNORABLE_SHALLOW.add(  # type: ignore[attr-defined]
-                f"<class '{typing_module_name}.{typing_type_name}'>")
-
-        # For each deprecated PEP 484-compliant typing attribute name...
-        for typing_attr_name in _HINT_PEP484_TYPING_ATTR_NAMES_DEPRECATED:
-            # Add that attribute relative to this module to this set.
-            # print(f'[datapeprepr] Registering deprecated "{typing_module_name}.{typing_attr_name}"...')
-            HINTS_PEP484_REPR_PREFIX_DEPRECATED.add(  # type: ignore[attr-defined]
-                f'{typing_module_name}.{typing_attr_name}')
+        # Note that these and the prior containers are intentionally
+        # populated by passing generator expressions to C-based update()
+        # methods rather than by iteratively setting or adding items in
+        # Python-based "for" loops, reducing import-time overhead.
+        HINT_TYPE_NAME_TO_SIGN.update(
+            (typing_module_prefix + typing_attr_name, hint_sign)
+            for typing_attr_name, hint_sign in (
+                _HINT_TYPE_BASENAMES_TO_SIGN.items())
+        )
 
     # ..................{ SYNTHESIS                          }..................
-    # Freeze all relevant global sets for safety.
+    # Note that these global frozen sets are intentionally constructed in a
+    # single shot from generator expressions rather than by iteratively adding
+    # items to intermediary mutable sets subsequently frozen, avoiding the
+    # construction of those intermediary sets.
+
+    # Frozen set of each deprecated PEP 484-compliant typing attribute name
+    # relative to each typing module.
     HINTS_PEP484_REPR_PREFIX_DEPRECATED = frozenset(
-        HINTS_PEP484_REPR_PREFIX_DEPRECATED)
-    HINTS_REPR_IGNORABLE_SHALLOW = frozenset(HINTS_REPR_IGNORABLE_SHALLOW)
+        typing_module_prefix + typing_attr_name
+        for typing_module_prefix in typing_module_prefixes
+        for typing_attr_name in _HINT_PEP484_TYPING_ATTR_NAMES_DEPRECATED
+    )
+
+    # Frozen set of each shallowly ignorable non-typing representation declared
+    # above *AND* each shallowly ignorable typing non-class attribute name and
+    # classname relative to each typing module.
+    HINTS_REPR_IGNORABLE_SHALLOW = frozenset((
+        *HINTS_REPR_IGNORABLE_SHALLOW,
+        *(
+            typing_module_prefix + typing_attr_name
+            for typing_module_prefix in typing_module_prefixes
+            for typing_attr_name in _HINT_TYPING_ATTR_NAMES_IGNORABLE
+        ),
+        *(
+            f"<class '{typing_module_prefix}{typing_type_name}'>"
+            for typing_module_prefix in typing_module_prefixes
+            for typing_type_name in _HINT_TYPING_TYPE_NAMES_IGNORABLE
+        ),
+    ))
 
     # ..................{ DEBUGGING                          }..................
     # Uncomment as needed to display the contents of these objects.
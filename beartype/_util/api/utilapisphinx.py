@@ -18,7 +18,7 @@ This private submodule is *not* intended for importation by downstream callers.
 # package via a module-scoped import. These imports should be isolated to the
 # bodies of callables declared below.
 #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
-from beartype._util.func.utilfuncframe import iter_frames
+from beartype._util.func.utilfuncframe import get_frame
 from sys import modules as module_imported_names
 
 # ....................{ TESTERS                            }....................
@@ -53,9 +53,25 @@ def is_sphinx_autodocing() -> bool:
     #version of Sphinx *AFTER* they resolve our feature request for this:
     #    https://github.com/sphinx-doc/sphinx/issues/9805
 
-    # For each stack frame on the call stack, ignoring the stack frame
-    # encapsulating the call to this tester...
-    for frame in iter_frames(func_stack_frames_ignore=1):
+    # If the active Python interpreter fails to declare the private
+    # sys._getframe() getter, silently reduce to returning false.
+    if get_frame is None:  # pragma: no cover
+        return False
+    # Else, the active Python interpreter declares the sys._getframe() getter.
+
+    # Stack frame encapsulating the call to the caller of this tester, ignoring
+    # the stack frame encapsulating the call to this tester. Since this tester
+    # is only ever called by other callables of this package, this frame
+    # *ALWAYS* exists.
+    #
+    # Note that the call stack is intentionally walked directly here rather
+    # than indirectly via the higher-level iter_frames() generator, avoiding
+    # the overhead of creating and resuming a generator across what is
+    # typically the entire call stack.
+    frame = get_frame(1)
+
+    # While at least one frame remains on the call stack...
+    while frame:
         # Fully-qualified name of this scope's module if this scope defines
         # this name *OR* "None" otherwise.
         frame_module_name = frame.f_globals.get('__name__')
@@ -70,6 +86,9 @@ def is_sphinx_autodocing() -> bool:
             return True
         # Else, this scope's module is *NOT* the "autodoc" extension.
 
+        # Iterate to the next frame on the call stack.
+        frame = frame.f_back
+
     # Else, *NO* scope's module is the "autodoc" extension. Return false.
     return False
 
@@ -52,9 +52,9 @@ def die_unless_type(
     # If this object is *NOT* a class, raise an exception.
     if not isinstance(cls, type):
         assert isinstance(exception_cls, type), (
-            'f{repr(exception_cls)} not exception class.')
+            f'{repr(exception_cls)} not exception class.')
         assert isinstance(exception_prefix, str), (
-            'f{repr(exception_prefix)} not string.')
+            f'{repr(exception_prefix)} not string.')
 
         raise exception_cls(f'{exception_prefix}{repr(cls)} not class.')
     # Else, this object is a class.
@@ -94,7 +94,7 @@ def die_unless_type_or_types(
     # raise an exception.
     if not is_type_or_types(type_or_types):
         assert isinstance(exception_cls, type), (
-            'f{repr(exception_cls)} not exception class.')
+            f'{repr(exception_cls)} not exception class.')
         assert issubclass(exception_cls, Exception), (
             f'{repr(exception_cls)} not exception subclass.')
         assert isinstance(exception_prefix, str), (
@@ -113,19 +113,18 @@ def die_unless_type_or_types(
                 exception_message += ' (i.e., is empty tuple)'
             # Else, this tuple is non-empty. In this case...
             else:
-                # For the 0-based index of each tuple item and that item...
-                for cls_index, cls in enumerate(type_or_types):
-                    # If this object is *NOT* a class...
-                    if not isinstance(cls, type):
-                        # Note this.
-                        exception_message += (
-                            f' (i.e., tuple item {cls_index} '
-                            f'{repr(cls)} not class)'
-                        )
-
-                        # Halt iteration.
-                        break
-                    # Else, this object is a class. Continue to the next item.
+                # 0-based index of the first non-class item of this tuple and
+                # that item. Since this tuple is *NOT* a tuple of one or more
+                # classes, this tuple is guaranteed to contain such an item.
+                cls_index, cls = next(
+                    (cls_index, cls)
+                    for cls_index, cls in enumerate(type_or_types)
+                    if not isinstance(cls, type)
+                )
+
+                # Note this.
+                exception_message += (
+                    f' (i.e., tuple item {cls_index} {repr(cls)} not class)')
         # Else, this object is a non-tuple. In this case, the general-purpose
         # exception message suffices.
 
@@ -151,19 +150,29 @@ def is_type_or_types(type_or_types: object) -> bool:
         more classes.
     '''
 
-    # Return true only if either...
-    return (
-        # This object is a class *OR*...
-        isinstance(type_or_types, type) or
-        (
-            # This object is a tuple *AND*...
-            isinstance(type_or_types, tuple) and
-            # This tuple is non-empty *AND*...
-            bool(type_or_types) and
-            # This tuple contains only classes.
-            all(isinstance(cls, type) for cls in type_or_types)
-        )
-    )
+    # If this object is a class, return true.
+    if isinstance(type_or_types, type):
+        return True
+    # Else, this object is *NOT* a class.
+    #
+    # If this object is either *NOT* a tuple or is the empty tuple, return
+    # false.
+    elif not (isinstance(type_or_types, tuple) and type_or_types):
+        return False
+    # Else, this object is a non-empty tuple.
+
+    # For each item of this tuple, return false if this item is *NOT* a class.
+    #
+    # Note that this iteration is intentionally performed with an explicit loop
+    # rather than by passing a generator expression to the all() builtin,
+    # avoiding the allocation of a generator object on each call.
+    for cls in type_or_types:
+        if not isinstance(cls, type):
+            return False
+        # Else, this item is a class.
+
+    # Return true. All tuple items are classes.
+    return True
 
 # ....................{ TESTERS ~ builtin                  }....................
 def is_type_builtin(cls: type) -> bool:
@@ -241,23 +250,19 @@ def is_type_builtin_or_fake(cls: type) -> bool:
         :data:`True` only if this object is a possibly fake builtin type.
     '''
 
-    # Avoid circular import dependencies.
-    from beartype._util.module.utilmodget import (
-        get_object_type_module_name_or_none)
-
-    # If this object is *NOT* a type, return false.
-    if not isinstance(cls, type):
-        return False
-    # Else, this object is a type.
-
-    # Fully-qualified name of the module defining this type if this type is
-    # defined by a module *OR* "None" otherwise (i.e., if this type is
-    # dynamically defined in-memory).
-    cls_module_name = get_object_type_module_name_or_none(cls)
-
-    # This return true only if this name is that of the "builtins" module
-    # declaring all builtin types.
-    return cls_module_name == BUILTINS_MODULE_NAME
+    # Return true only if...
+    return (
+        # This object is a type *AND*...
+        isinstance(cls, type) and
+        # This type insists itself to be defined by the "builtins" module
+        # declaring all builtin types.
+        #
+        # Note that this attribute is intentionally accessed directly rather
+        # than by calling the get_object_type_module_name_or_none() getter,
+        # avoiding both a deferred import and a chain of three function calls.
+        # Since this object is a type, that getter reduces to this access.
+        getattr(cls, '__module__', None) == BUILTINS_MODULE_NAME
+    )
 
 # ....................{ TESTERS ~ subclass                 }....................
 def is_type_subclass(
@@ -310,8 +315,13 @@ def is_type_subclass(
         :data:`True` only if this object is an inclusive subclass of these
         superclass(es).
     '''
-    assert isinstance(base_classes, TestableTypesTuple), (
-        f'{repr(base_classes)} neither class nor tuple of classes.')
+    assert (
+        # Note that these object identity tests efficiently short-circuit the
+        # common case of superclasses whose type is *NOT* a metaclass.
+        type(base_classes) is type or
+        type(base_classes) is tuple or
+        isinstance(base_classes, TestableTypesTuple)
+    ), f'{repr(base_classes)} neither class nor tuple of classes.'
 
     # Return true only if...
     return (
@@ -323,7 +333,6 @@ def is_type_subclass(
     )
 
 
-#FIXME: Unit test us up, please.
 def is_type_subclass_proper(
     cls: object, base_classes: TypeOrTupleTypes) -> bool:
     '''
@@ -355,8 +364,13 @@ def is_type_subclass_proper(
         ``True`` only if this object is a proper subclass of these
         superclass(es).
     '''
-    assert isinstance(base_classes, TestableTypesTuple), (
-        f'{repr(base_classes)} neither class nor tuple of classes.')
+    assert (
+        # Note that these object identity tests efficiently short-circuit the
+        # common case of superclasses whose type is *NOT* a metaclass.
+        type(base_classes) is type or
+        type(base_classes) is tuple or
+        isinstance(base_classes, TestableTypesTuple)
+    ), f'{repr(base_classes)} neither class nor tuple of classes.'
 
     # Return true only if...
     return (
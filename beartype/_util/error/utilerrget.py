@@ -12,6 +12,7 @@ This private submodule is *not* intended for importation by downstream callers.
 
 # ....................{ IMPORTS                            }....................
 from beartype.roar._roarexc import _BeartypeUtilExceptionException
+from beartype._util.py.utilpyversion import IS_PYTHON_AT_LEAST_3_10
 from beartype._util.text.utiltextlabel import label_exception
 
 # ....................{ GETTERS                            }....................
@@ -53,6 +54,19 @@ def get_name_error_attr_name(name_error: NameError) -> str:
     assert isinstance(name_error, NameError), (
         f'{repr(name_error)} not "NameError" exception.')
 
+    # If the active Python interpreter targets Python >= 3.10 *AND* this name
+    # error directly provides the unqualified basename of this attribute via
+    # the "NameError.name" instance variable, return that basename as is.
+    #
+    # Note that this variable is *NOT* necessarily defined. The active Python
+    # interpreter only defines this variable for some name errors it raises
+    # (e.g., *NOT* for "UnboundLocalError" exceptions under Python 3.11), while
+    # name errors manually raised by third-party code rarely define this
+    # variable. In these cases, fallback to parsing this error's message below.
+    if IS_PYTHON_AT_LEAST_3_10 and name_error.name:  # type: ignore[attr-defined]
+        return name_error.name  # type: ignore[attr-defined]
+    # Else, this name error fails to provide this basename.
+
     # Message associated with this name error.
     error_message = str(name_error)
 
@@ -110,6 +110,15 @@ def get_func_codeobj(
          If this codeobjable has *no* code object and is thus *not* pure-Python.
     '''
 
+    # If this callable is a pure-Python function *AND* the caller requested
+    # that this function *NOT* be unwrapped, return the code object of this
+    # function as is. This is the overwhelmingly common case, which this getter
+    # optimizes by avoiding calling the more general-purpose getter below.
+    if type(func) is FunctionType and not is_unwrap:
+        return func.__code__
+    # Else, this callable is either *NOT* a pure-Python function *OR* the
+    # caller requested that this function be unwrapped.
+
     # Code object underlying this callable if this callable is pure-Python *OR*
     # "None" otherwise.
     func_codeobj = get_func_codeobj_or_none(func=func, is_unwrap=is_unwrap)
@@ -212,17 +221,18 @@ def get_func_codeobj_or_none(
     #   __getattribute__() dunder methods (either of which could raise
     #   arbitrary exceptions) and is thus considerably less safe.
     #
-    # If this object is already a code object, return this object as is.
-    if isinstance(func, CodeType):
-        return func
-    # Else, this object is *NOT* already a code object.
-    #
     # If this object is a pure-Python function...
     #
-    # Note that this test intentionally leverages the standard
-    # "types.FunctionType" class rather than our equivalent
-    # "beartype.cave.FunctionType" class to avoid circular import issues.
-    elif isinstance(func, FunctionType):
+    # Note that:
+    # * This test is intentionally performed first, as pure-Python functions
+    #   are the overwhelmingly common case (e.g., inside @beartype).
+    # * This test is an object identity test rather than a call to the
+    #   isinstance() builtin. Since the "types.FunctionType" class is *NOT*
+    #   subclassable, both are equivalent.
+    # * This test intentionally leverages the standard "types.FunctionType"
+    #   class rather than our equivalent "beartype.cave.FunctionType" class to
+    #   avoid circular import issues.
+    if type(func) is FunctionType:
         #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
         # CAUTION: Synchronize this with the same test below (for methods).
         #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
@@ -233,6 +243,11 @@ def get_func_codeobj_or_none(
         return (unwrap_func_all(func) if is_unwrap else func).__code__  # type: ignore[attr-defined]
     # Else, this object is *NOT* a pure-Python function.
     #
+    # If this object is already a code object, return this object as is.
+    elif isinstance(func, CodeType):
+        return func
+    # Else, this object is *NOT* already a code object.
+    #
     # If this callable is a bound method, return this method's code object.
     #
     # Note this test intentionally tests the standard "types.MethodType" class
@@ -248,7 +263,7 @@ def get_func_codeobj_or_none(
         #removed with all haste.
 
         # If this unbound function is pure-Python...
-        if isinstance(func, FunctionType):
+        if type(func) is FunctionType:
             #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
             # CAUTION: Synchronize this with the same test above.
             #!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
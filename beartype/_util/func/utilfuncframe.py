@@ -258,8 +258,10 @@ def iter_frames(
     Notably, for each:
 
     * **C-based callable call** (i.e., call of a C-based rather than
-      pure-Python callable), this generator yields one frame encapsulating *no*
-      code object. Only pure-Python frame objects have code objects.
+      pure-Python callable), this generator yields *no* frame. Only calls to
+      pure-Python callables push frames onto the call stack. Ergo, *all* frames
+      yielded by this generator encapsulate code objects (i.e.,
+      ``func_frame.f_code`` is *never* :data:`None`).
     * **Class-scoped callable call** (i.e., call of an arbitrary callable
       occurring at class scope rather than from within the body of a callable
       or class, typically due to a method being decorated), this generator
@@ -278,10 +280,6 @@ def iter_frames(
       the active Python interpreter to all scopes encapsulating the top-most
       lexical scope of a module in the current call stack).
 
-    The above constraints imply that frames yielded by this generator *cannot*
-    be assumed to encapsulate code objects. See the "Examples" subsection for
-    standard logic handling this edge case.
-
     Caveats
     -------
     **This high-level iterator requires the private low-level**
@@ -308,23 +306,12 @@ def iter_frames(
 
     Examples
     --------
-        >>> from beartype._util.func.utilfunccodeobj import (
-        ...     get_func_codeobj_or_none)
         >>> from beartype._util.func.utilfuncframe import iter_frames
 
         # For each stack frame on the call stack...
         >>> for func_frame in iter_frames():
-        ...     # Code object underlying this frame's scope if this scope is
-        ...     # pure-Python *OR* "None" otherwise.
-        ...     func_frame_codeobj = get_func_codeobj_or_none(func_frame)
-        ...
-        ...     # If this code object does *NOT* exist, this scope is C-based.
-        ...     # In this case, silently ignore this scope and proceed to the
-        ...     # next frame in the call stack.
-        ...     if func_frame_codeobj is None:
-        ...         continue
-        ...     # Else, this code object exists, implying this scope to be
-        ...     # pure-Python.
+        ...     # Code object underlying this frame's scope.
+        ...     func_frame_codeobj = func_frame.f_code
         ...
         ...     # Fully-qualified name of this scope's module.
         ...     func_frame_module_name = func_frame.f_globals['__name__']
@@ -19,6 +19,13 @@ from beartype.typing import (
     Any,
     Optional,
 )
+from beartype._util.func.utilfuncframe import iter_frames
+from beartype._util.func.utilfunctest import (
+    die_unless_func_python,
+    is_func_nested,
+)
+from beartype._util.func.utilfuncwrap import unwrap_func_all_isomorphic
+from beartype._util.module.utilmodget import get_object_module_name_or_none
 from beartype._util.utilobject import get_object_basename_scoped
 from beartype._data.func.datafunccodeobj import FUNC_CODEOBJ_NAME_MODULE
 from beartype._data.hint.datahinttyping import (
@@ -78,10 +85,6 @@ def get_func_globals(
     '''
     assert callable(func), f'{repr(func)} not callable.'
 
-    # Avoid circular import dependencies.
-    from beartype._util.func.utilfunctest import die_unless_func_python
-    from beartype._util.func.utilfuncwrap import unwrap_func_all_isomorphic
-
     # If this callable is *NOT* pure-Python, raise an exception. C-based
     # callables do *NOT* define the "__globals__" dunder attribute.
     die_unless_func_python(func=func, exception_cls=exception_cls)
@@ -214,13 +217,6 @@ def get_func_locals(
         f'{func_stack_frames_ignore} negative.')
     # print(f'\n--------- Capturing nested {func.__qualname__}() local scope...')
 
-    # ..................{ IMPORTS                            }..................
-    # Avoid circular import dependencies.
-    from beartype._util.func.utilfunccodeobj import get_func_codeobj_or_none
-    from beartype._util.func.utilfuncframe import iter_frames
-    from beartype._util.func.utilfunctest import is_func_nested
-    from beartype._util.module.utilmodget import get_object_module_name_or_none
-
     # ..................{ NOOP                               }..................
     # Fully-qualified name of the module declaring the passed callable if that
     # callable was physically declared by an on-disk module *OR* "None"
@@ -426,15 +422,14 @@ def get_func_locals(
         # call to this getter.
         func_stack_frames_ignore=func_stack_frames_ignore + 1,
     ):
-        # Code object underlying this frame's scope if that scope is
-        # pure-Python *OR* "None" otherwise.
-        func_frame_codeobj = get_func_codeobj_or_none(func_frame)
-
-        # If this code object does *NOT* exist, this scope is C-based. In this
-        # case, silently ignore this scope and proceed to the next frame.
-        if func_frame_codeobj is None:
-            continue
-        # Else, this code object exists, implying this scope to be pure-Python.
+        # Code object underlying this frame's scope.
+        #
+        # Note that this code object is intentionally accessed directly rather
+        # than indirectly via the get_func_codeobj_or_none() getter, avoiding a
+        # Python-level call and type-checking ladder per frame. Since only
+        # pure-Python scopes push frames onto the call stack, *ALL* frames
+        # yielded by iter_frames() are guaranteed to have code objects.
+        func_frame_codeobj = func_frame.f_code
 
         # Fully-qualified name of that scope's module.
         func_frame_module_name = func_frame.f_globals['__name__']
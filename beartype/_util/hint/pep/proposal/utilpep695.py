@@ -112,6 +112,7 @@ from beartype._cave._cavefast import HintPep695Type
 from beartype._check.forward.reference.fwdrefmeta import BeartypeForwardRefMeta
 from beartype._check.forward.reference.fwdrefmake import (
     make_forwardref_indexable_subtype)
+from beartype._data.kind.datakinddict import DICT_EMPTY
 from beartype._util.error.utilerrget import get_name_error_attr_name
 from beartype._util.module.utilmodget import get_module_imported_or_none
 
@@ -187,27 +188,28 @@ def get_hint_pep695_alias(
     '''
 
     # If this hint is *NOT* a PEP 695-compliant type alias, raise an exception.
-    if not isinstance(hint, HintPep695Type):
+    # Since the "typing.TypeAliasType" class is *NOT* subclassable, type
+    # identity suffices here and below.
+    if type(hint) is not HintPep695Type:
         raise BeartypeDecorHintPep695Exception(
             f'{exception_prefix}type hint {repr(hint)} '
             f'not PEP 695 type alias.'
         )
     # Else, this hint is a PEP 695-compliant type alias.
 
-    # While the Universe continues infinitely expanding...
-    while True:
-        # Reduce this type alias to the type hint aliased by this alias, which
-        # itself is possibly a nested type alias. Oh, it happens.
-        #
-        # Note that doing so implicitly raises a "NameError" if this alias
-        # contains one or more unquoted forward references to undefined types.
+    # Reduce this type alias to the type hint aliased by this alias, which
+    # itself is possibly a nested type alias. Oh, it happens.
+    #
+    # Note that doing so implicitly raises a "NameError" if this alias contains
+    # one or more unquoted forward references to undefined types.
+    hint = hint.__value__  # type: ignore[attr-defined]
+
+    # While this type hint is a nested type alias, iteratively unwrap this
+    # nested type alias. Since nested type aliases are uncommon, this loop
+    # typically performs *NO* iterations.
+    while type(hint) is HintPep695Type:
         hint = hint.__value__  # type: ignore[attr-defined]
-
-        # If this type hint is *NOT* a nested type alias, break this iteration.
-        if not isinstance(hint, HintPep695Type):
-            break
-        # Else, this type hint is a nested type alias. In this case, continue
-        # iteratively unwrapping this nested type alias.
+    # Else, this type hint is *NOT* a nested type alias.
 
     # Return this unaliased type alias.
     return hint
@@ -270,9 +272,6 @@ def iter_hint_pep695_forwardrefs(
             # Reduce this alias to the type hint it lazily refers to. If this
             # alias contains *NO* forward references to undeclared attributes,
             # this reduction *SHOULD* succeed. Let's pretend we mean that.
-            #
-            # Note that get_hint_pep695_alias() is memoized and thus
-            # intentionally called with positional arguments.
             get_hint_pep695_alias(hint, exception_prefix)
 
             # This reduction raised *NO* exception and thus succeeded. In this
@@ -282,30 +281,54 @@ def iter_hint_pep695_forwardrefs(
         # contains one or more forward references to undeclared attributes. In
         # this case...
         except NameError as exception:
-            # Unqualified basename of this alias (i.e., name of the global or
-            # local variable assigned to by the left-hand side of this alias).
-            hint_name = repr(hint)
-
-            # Fully-qualified name of the external third-party module defining
-            # this alias.
-            hint_module_name = hint.__module__
-            # print(f'hint_module_name: {hint_module_name}')
-
-            # If this alias defines *NO* module name, raise an exception.
-            #
-            # Note that this should *NEVER* happen. Nonetheless, static
-            # type-checkers like mypy insist this can happen. It almost
-            # certainly can't. Nonetheless, let's dot our i's and cross our t's.
-            if not hint_module_name:
-                raise BeartypeDecorHintPep695Exception(
-                    f'{exception_prefix}PEP 695 type alias "{hint_name}" '
-                    f'module undefined (i.e., "__module__" attribute '
-                    f'either "None" or the empty string).'
-                ) from exception
-            # Else, this alias defines a module name.
-
-            # That module as its previously imported object.
-            hint_module = get_module_imported_or_none(hint_module_name)
+            # If this is the first undeclared attribute in this alias, localize
+            # metadata describing this alias. Since this metadata is invariant
+            # across iterations of this loop, this metadata is intentionally
+            # computed exactly once on the first such iteration rather than
+            # either repeatedly on each such iteration *OR* eagerly before this
+            # loop (which would needlessly slow the common case of aliases
+            # containing *NO* forward references to undeclared attributes).
+            if hint_ref_name_prev is None:
+                # Unqualified basename of this alias (i.e., name of the global
+                # or local variable assigned to by the left-hand side of this
+                # alias).
+                hint_name = repr(hint)
+
+                # Fully-qualified name of the external third-party module
+                # defining this alias.
+                hint_module_name = hint.__module__
+                # print(f'hint_module_name: {hint_module_name}')
+
+                # If this alias defines *NO* module name, raise an exception.
+                #
+                # Note that this should *NEVER* happen. Nonetheless, static
+                # type-checkers like mypy insist this can happen. It almost
+                # certainly can't. Nonetheless, let's dot our i's and cross our
+                # t's.
+                if not hint_module_name:
+                    raise BeartypeDecorHintPep695Exception(
+                        f'{exception_prefix}PEP 695 type alias "{hint_name}" '
+                        f'module undefined (i.e., "__module__" attribute '
+                        f'either "None" or the empty string).'
+                    ) from exception
+                # Else, this alias defines a module name.
+
+                # That module as its previously imported object.
+                hint_module = get_module_imported_or_none(hint_module_name)
+
+                # Global scope of that module if that module has been imported
+                # *OR* the empty dictionary otherwise.
+                #
+                # Note that this scope is intentionally accessed directly below
+                # rather than indirectly via the hasattr() builtin. The latter
+                # both invokes the descriptor protocol *AND* any module-scoped
+                # __getattr__() dunder function (which has *NO* relevance to
+                # the global variables resolving forward references), whereas
+                # the former reduces to a single dictionary lookup.
+                hint_module_globals = (
+                    DICT_EMPTY if hint_module is None else hint_module.__dict__)
+            # Else, this metadata has already been localized by a prior
+            # iteration of this loop.
 
             # Unqualified basename of the next remaining undeclared attribute
             # contained in this alias relative to that module.
@@ -373,7 +396,7 @@ def iter_hint_pep695_forwardrefs(
             # attribute as a global variable, raise an exception.
             #
             # Note that this should *NEVER* happen. Of course, this will happen.
-            elif hasattr(hint_module, hint_ref_name):
+            elif hint_ref_name in hint_module_globals:
                 raise BeartypeDecorHintPep695Exception(  # pragma: no cover
                     f'{exception_prefix}PEP 695 type alias "{hint_name}" '
                     f'unquoted relative forward reference "{hint_ref_name}" '
@@ -453,9 +476,6 @@ def reduce_hint_pep695(
         # Reduce this alias to the type hint it lazily refers to. If this alias
         # contains *NO* forward references to undeclared attributes, this
         # reduction *SHOULD* succeed. Let's pretend we mean that.
-        #
-        # Note that get_hint_pep695_alias() is memoized and thus
-        # intentionally called with positional arguments.
         hint_aliased = get_hint_pep695_alias(hint, exception_prefix)
     # If doing so raises a builtin "NameError" exception, this alias contains
     # one or more forward references to undeclared attributes. In this case...
@@ -55,9 +55,9 @@ def die_unless_identifier(
     # If this string is *NOT* a valid Python attribute name, raise an exception.
     if not (isinstance(text, str) and is_identifier(text)):
         assert isinstance(exception_cls, type), (
-            'f{repr(exception_cls)} not exception class.')
+            f'{repr(exception_cls)} not exception class.')
         assert isinstance(exception_prefix, str), (
-            'f{repr(exception_prefix)} not string.')
+            f'{repr(exception_prefix)} not string.')
 
         raise exception_cls(
             f'{exception_prefix}{repr(text)} not valid Python attribute name.')
@@ -52,7 +52,13 @@ def test_is_type_subclass() -> None:
 
     # Defer test-specific imports.
     from beartype._util.cls.utilclstest import is_type_subclass
-    from beartype_test.a00_unit.data.data_type import Class, Subclass
+    from beartype_test.a00_unit.data.data_type import (
+        Class,
+        OtherClass,
+        OtherSubclass,
+        Subclass,
+        UnhashableClass,
+    )
 
     # Assert this tester accepts objects that are subclasses of superclasses.
     assert is_type_subclass(Subclass, Class) is True
@@ -67,11 +73,61 @@ def test_is_type_subclass() -> None:
     # Assert this tester rejects objects that are unrelated classes.
     assert is_type_subclass(str, bool) is False
 
+    # Assert this tester rejects unhashable classes that are unrelated to
+    # several superclasses *WITHOUT* raising an exception.
+    assert is_type_subclass(
+        UnhashableClass, (Class, OtherClass, OtherSubclass, bool, str)) is False
+
     # Assert this tester rejects objects that are non-classes *WITHOUT* raising
     # an exception.
     assert is_type_subclass(
         "Thou many-colour'd, many-voiced vale,", str) is False
 
+
+def test_is_type_subclass_proper() -> None:
+    '''
+    Test the :func:`beartype._util.cls.utilclstest.is_type_subclass_proper`
+    tester.
+    '''
+
+    # Defer test-specific imports.
+    from beartype._util.cls.utilclstest import is_type_subclass_proper
+    from beartype_test.a00_unit.data.data_type import (
+        Class,
+        OtherClass,
+        OtherSubclass,
+        Subclass,
+        SubclassSubclass,
+        UnhashableClass,
+    )
+
+    # Arbitrary tuple of several superclasses.
+    BASE_CLASSES_LONG = (Class, OtherClass, OtherSubclass, bool, str)
+
+    # Assert this tester accepts objects that are proper subclasses of
+    # superclasses.
+    assert is_type_subclass_proper(Subclass, Class) is True
+    assert is_type_subclass_proper(Subclass, (Class, str)) is True
+    assert is_type_subclass_proper(SubclassSubclass, BASE_CLASSES_LONG) is True
+
+    # Assert this tester rejects objects that are these superclasses themselves.
+    assert is_type_subclass_proper(Class, Class) is False
+    assert is_type_subclass_proper(Class, (Class, str)) is False
+    for base_class in BASE_CLASSES_LONG:
+        assert is_type_subclass_proper(base_class, BASE_CLASSES_LONG) is False
+
+    # Assert this tester rejects objects that are superclasses of subclasses.
+    assert is_type_subclass_proper(Class, Subclass) is False
+
+    # Assert this tester rejects unhashable classes that are unrelated to these
+    # superclasses *WITHOUT* raising an exception.
+    assert is_type_subclass_proper(UnhashableClass, BASE_CLASSES_LONG) is False
+
+    # Assert this tester rejects objects that are non-classes *WITHOUT* raising
+    # an exception.
+    assert is_type_subclass_proper(
+        'Of heaven and earth, and all that in them are,', str) is False
+
 # ....................{ TESTS ~ tester : builtin           }....................
 def test_is_type_builtin() -> None:
     '''
@@ -106,6 +162,7 @@ def test_is_type_builtin_or_fake() -> None:
         TYPES_BUILTIN,
         TYPES_BUILTIN_FAKE,
         Class,
+        UnhashableClass,
     )
 
     # Assert this tester accepts all non-fake builtin types.
@@ -118,3 +175,7 @@ def test_is_type_builtin_or_fake() -> None:
 
     # Assert this tester rejects an arbitrary non-builtin type.
     assert is_type_builtin_or_fake(Class) is False
+
+    # Assert this tester rejects an unhashable non-builtin type *WITHOUT*
+    # raising an exception.
+    assert is_type_builtin_or_fake(UnhashableClass) is False
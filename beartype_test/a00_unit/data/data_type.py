@@ -203,6 +203,26 @@ class NonIssubclassableClass(object, metaclass=NonIssubclassableMetaclass):
 
     pass
 
+# ....................{ CLASSES ~ unhashable               }....................
+class UnhashableMetaclass(type):
+    '''
+    Metaclass overriding the ``__eq__()`` but *not* ``__hash__()`` dunder
+    methods, implicitly nullifying the latter and thus preventing classes with
+    this metaclass from being hashed (e.g., as frozen set items).
+    '''
+
+    def __eq__(self, other: object) -> bool:
+        return self is other
+
+
+class UnhashableClass(object, metaclass=UnhashableMetaclass):
+    '''
+    Class whose metaclass overrides the ``__eq__()`` but *not* ``__hash__()``
+    dunder methods, preventing this class from being hashed.
+    '''
+
+    pass
+
 # ....................{ CLASSES ~ with : module name       }....................
 class ClassModuleNameFake(object):
     '''
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# --------------------( LICENSE                            )--------------------
+# Copyright (c) 2014-2024 Beartype authors.
+# See "LICENSE" for further details.
+
+'''
+Profile-guided reordering of the private
+:data:`beartype._data.cls.datacls.TYPES_BEARTYPEABLE` tuple.
+
+This script imports all passed modules, visits *all* classes transitively
+defined by those modules in the same way the :func:`beartype.beartype`
+decorator visits class attributes, counts the number of attributes matching
+each item of that tuple, and prints those items in descending order of
+frequency. If the ``--write`` option is passed, this script additionally
+rewrites the body of that tuple in-place in that order, preserving the comments
+preceding each item. Since :func:`isinstance` tests tuple items in order,
+listing the most frequent types first shaves a type comparison off the common
+case of each :func:`isinstance` test against that tuple.
+
+This script is intended to be run manually by maintainers against large
+real-world codebases from the root of the repository, which must be on the
+import path (e.g., ``PYTHONPATH=. python3 bin/sort_beartypeable.py numpy pandas
+--write``).
+Since profiling occurs offline, the :func:`beartype.beartype` decorator itself
+remains free of profiling overhead.
+'''
+
+# ....................{ IMPORTS                            }....................
+from argparse import ArgumentParser
+from beartype._data.cls import datacls
+from collections import Counter
+from importlib import import_module
+from pathlib import Path
+from pkgutil import walk_packages
+import re
+
+# ....................{ GLOBALS                            }....................
+DATACLS_FILENAME = Path(datacls.__file__)
+'''
+Absolute filename of the submodule defining the tuple to be reordered.
+'''
+
+
+TYPES_BEARTYPEABLE_REGEX = re.compile(
+    r'^(TYPES_BEARTYPEABLE = \(\n)(.*?)(^\)\n)', re.MULTILINE | re.DOTALL)
+'''
+Compiled regular expression matching the declaration of the tuple to be
+reordered, capturing the body of that tuple as its second group.
+'''
+
+
+ITEM_REGEX = re.compile(
+    r'((?:^    #.*\n)*)^    (\w+),\n', re.MULTILINE)
+'''
+Compiled regular expression matching each item of the body of the tuple to be
+reordered, capturing all comment lines preceding that item as its first group
+and the name of that item as its second group.
+'''
+
+# ....................{ PROFILERS                          }....................
+def iter_modules(module_names):
+    '''
+    Generator iteratively yielding each module with the passed names *and* all
+    submodules of those modules that are packages, silently skipping all
+    submodules and subpackages failing to import for any reason.
+    '''
+
+    # For the name of each passed module...
+    for module_name in module_names:
+        module = import_module(module_name)
+        yield module
+
+        # If this module is a package, yield all importable submodules.
+        #
+        # Note that walk_packages() itself imports each subpackage to find its
+        # submodules. Without an "onerror" callback, non-"ImportError"
+        # exceptions raised while doing so would propagate and abort this run.
+        # With this callback, all such subpackages are silently skipped.
+        for _, submodule_name, _ in walk_packages(
+            getattr(module, '__path__', ()),
+            prefix=f'{module_name}.',
+            onerror=lambda subpackage_name: None,
+        ):
+            try:
+                yield import_module(submodule_name)
+            except Exception:
+                pass
+
+
+def get_item_name_matched(attr_value, items):
+    '''
+    Name of the first item of the passed list of 2-tuples
+    ``(item_name, item)`` such that the passed attribute value is an instance
+    of that item if any *or* :data:`None` otherwise.
+    '''
+
+    # For the name of each item and that item, return that name if this
+    # attribute value is an instance of that item.
+    for item_name, item in items:
+        if isinstance(attr_value, item):
+            return item_name
+
+    # Else, this attribute value is an instance of no item. Return "None".
+    return None
+
+
+def count_types_beartypeable(module_names, item_names):
+    '''
+    :class:`collections.Counter` mapping from the name of each item of the
+    tuple to be reordered to the number of class attributes matching that item
+    across all classes defined by all passed modules.
+    '''
+
+    # Items of the tuple to be reordered, resolved against that submodule.
+    items = [(item_name, getattr(datacls, item_name)) for item_name in item_names]
+    item_name_to_count = Counter({item_name: 0 for item_name in item_names})
+
+    # Set of the IDs of all previously visited classes.
+    cls_ids_visited = set()
+
+    # Stack of all classes to be visited.
+    clses = [
+        module_attr
+        for module in iter_modules(module_names)
+        for module_attr in vars(module).values()
+        if isinstance(module_attr, type)
+    ]
+
+    # While one or more classes remain to be visited...
+    while clses:
+        cls = clses.pop()
+        if id(cls) in cls_ids_visited:
+            continue
+        cls_ids_visited.add(id(cls))
+
+        # For the name and value of each direct attribute of this class...
+        for attr_name, attr_value in cls.__dict__.items():
+            # Name of the first item this attribute matches (mirroring the
+            # isinstance() short-circuit) if any *OR* "None" otherwise.
+            item_name_matched = get_item_name_matched(attr_value, items)
+
+            # If this attribute is *NOT* directly beartypeable, fallback to
+            # the dynamic value of this attribute with regard to descriptor
+            # lookup (mirroring the same fallback performed by the
+            # beartype._decor._decortype.beartype_type() decorator).
+            if item_name_matched is None:
+                try:
+                    item_name_matched = get_item_name_matched(
+                        getattr(cls, attr_name), items)
+                # If this lookup fails, silently ignore this attribute.
+                except Exception:
+                    pass
+
+            # If this attribute is beartypeable, count this item.
+            if item_name_matched is not None:
+                item_name_to_count[item_name_matched] += 1
+
+            # If this attribute is a nested class, visit that class as well.
+            if isinstance(attr_value, type):
+                clses.append(attr_value)
+
+    # Return this counter.
+    return item_name_to_count
+
+# ....................{ MAIN                               }....................
+def main():
+    '''
+    Run this script.
+    '''
+
+    parser = ArgumentParser(description=__doc__.split('\n\n')[1])
+    parser.add_argument(
+        'module_names', nargs='+', metavar='MODULE',
+        help='fully-qualified name of a module or package to be profiled')
+    parser.add_argument(
+        '--write', action='store_true',
+        help=f'rewrite "TYPES_BEARTYPEABLE" in "{DATACLS_FILENAME}" in place')
+    args = parser.parse_args()
+
+    # Parse the body of the tuple to be reordered into a dictionary mapping
+    # from the name of each item to the source code declaring that item.
+    datacls_code = DATACLS_FILENAME.read_text()
+    tuple_match = TYPES_BEARTYPEABLE_REGEX.search(datacls_code)
+    if tuple_match is None:
+        raise SystemExit(
+            f'"TYPES_BEARTYPEABLE" declaration not found in '
+            f'"{DATACLS_FILENAME}".'
+        )
+    item_name_to_code = {
+        item_match.group(2): item_match.group(0)
+        for item_match in ITEM_REGEX.finditer(tuple_match.group(2))
+    }
+
+    # Profile these modules and print the resulting frequencies.
+    item_name_to_count = count_types_beartypeable(
+        args.module_names, item_name_to_code.keys())
+    for item_name, count in item_name_to_count.most_common():
+        print(f'{count:>10}  {item_name}')
+
+    # If the caller requested this tuple be rewritten, do so.
+    if args.write:
+        tuple_body = ''.join(
+            item_name_to_code[item_name]
+            for item_name, _ in item_name_to_count.most_common()
+        )
+        DATACLS_FILENAME.write_text(
+            datacls_code[:tuple_match.start(2)] +
+            tuple_body +
+            datacls_code[tuple_match.end(2):]
+        )
+        print(f'Rewrote "TYPES_BEARTYPEABLE" in "{DATACLS_FILENAME}".')
+
+
+if __name__ == '__main__':
+    main()